@@ -19,17 +19,19 @@ def get_local_dir():
     if "dir" not in paths:
         print(f"Paths definition file '{path_pathfile}' does not contain 'dir' key; {msg}")
         return ".local"
-    if not isinstance(paths["dir"], dict):
+    dir_paths = paths["dir"]
+    if not isinstance(dir_paths, dict):
         print(f"Paths definition file's '{path_pathfile}' 'dir' key is not a dictionary; {msg}")
         return ".local"
-    if "local" not in paths["dir"]:
+    if "local" not in dir_paths:
         print(f"Paths definition file's '{path_pathfile}' 'dir' key does not contain 'local' key; {msg}")
         return ".local"
-    if not isinstance(paths["dir"]["local"], str):
+    local_path = dir_paths["local"]
+    if not isinstance(local_path, str):
         print(f"Paths definition file's '{path_pathfile}' 'dir' key's 'local' key is not a string; {msg}")
         return ".local"
-    print(f"Setting local path to '{paths['dir']['local']}'.")
-    return paths["dir"]["local"]
+    print(f"Setting local path to '{local_path}'.")
+    return local_path
 
 
 def copy_requirements_file(action_path: str, local_path: str) -> str: